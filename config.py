@@ -7,6 +7,30 @@ Modify these settings to customize the scraper behavior.
 # Discord Configuration
 DISCORD_WEBHOOK_URL = 'https://discord.com/api/webhooks/1403126483786006611/WwPtj093M8bN9jtqYa7DjIEdTQiqJ5kAE8eNPgz8w4_G36MGtrp6sYy01gCKC-IQjVeI'  # Set via environment variable DISCORD_WEBHOOK_URL
 
+# Additional Notification Sinks (leave empty to disable)
+SLACK_WEBHOOK_URL = ''  # Slack-compatible incoming webhook, or env SLACK_WEBHOOK_URL
+SMTP_HOST = ''  # e.g. "smtp.gmail.com", or env SMTP_HOST
+SMTP_PORT = 587
+SMTP_USERNAME = ''  # Set via environment variable SMTP_USERNAME
+SMTP_PASSWORD = ''  # Set via environment variable SMTP_PASSWORD
+SMTP_USE_TLS = True
+EMAIL_FROM = ''
+EMAIL_TO = []  # List of recipient addresses
+NOTIFY_JSONL_FILE = ''  # e.g. "notifications.jsonl" to log notifications locally
+
+# Notification Delivery (applied to each sink independently)
+NOTIFY_TIMEOUT = 10  # Seconds per delivery attempt
+NOTIFY_RETRY_ATTEMPTS = 3
+# Breaker state is saved in NOTIFY_STATE_FILE, so it carries over between daily runs
+NOTIFY_BREAKER_THRESHOLD = 3  # Consecutive failed runs before a sink is paused
+NOTIFY_BREAKER_RESET = 12 * 3600  # Seconds before a paused sink is tried again (keep below one day)
+NOTIFY_STATE_FILE = "notify_state.pkl"  # Circuit breaker state, kept next to DATA_FILE
+
+# Per-sink overrides: NOTIFY_<SINK>_<SETTING> with SINK one of DISCORD, SLACK,
+# EMAIL, FILE and SETTING one of TIMEOUT, RETRY_ATTEMPTS, BREAKER_THRESHOLD,
+# BREAKER_RESET. Unset ones use the NOTIFY_* values above. For example:
+# NOTIFY_EMAIL_TIMEOUT = 30  # SMTP servers can be slower than webhooks
+
 # Job Keywords to Monitor (must contain at least one of these)
 TARGET_KEYWORDS = [
         'electrical',
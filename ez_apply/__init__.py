@@ -0,0 +1,11 @@
+"""
+OpenAI Careers Job Scraper
+Monitors OpenAI careers website for electrical engineering positions
+and sends notifications for new job postings.
+
+Heavy dependencies (selenium, webdriver_manager, bs4, requests) are only
+imported by the code paths that use them, so importing this package and
+running non-browser commands stays fast.
+"""
+
+__version__ = "0.2.0"
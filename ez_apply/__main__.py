@@ -0,0 +1,6 @@
+"""Allow running the scraper CLI with `python -m ez_apply`"""
+
+from ez_apply.cli import main
+
+if __name__ == "__main__":
+    main()
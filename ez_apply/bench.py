@@ -0,0 +1,79 @@
+"""
+Benchmarks for the scraper
+Replays a job fixture through filtering/deduplication and profiles the
+cold import time of each entry point with `python -X importtime`.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Modules whose cold import cost is reported by `bench --imports`.
+# The last entry is the set ez-apply.py used to import eagerly on every run.
+IMPORT_TARGETS = [
+    ("cli", "ez_apply.cli"),
+    ("check", "ez_apply.store"),
+    ("run (no browser)", "ez_apply.scraper"),
+    ("eager dependencies", "selenium.webdriver, webdriver_manager.chrome, requests, bs4"),
+]
+
+IMPORT_MARKER = "--- ez_apply import profile ---"
+
+
+def replay_fixture(path: str, repeat: int = 1000) -> Dict[str, float]:
+    """Time filtering and deduplication of a fixture, starting from an empty seen-jobs set"""
+    from ez_apply.notifiers import NotificationDispatcher
+    from ez_apply.scraper import OpenAICareersScraper
+
+    scraper = OpenAICareersScraper(dispatcher=NotificationDispatcher([]))
+    all_jobs = scraper.load_fixture_jobs(path)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scraper.known_job_titles = set()
+        new_jobs = scraper.find_new_jobs(all_jobs)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "jobs": len(all_jobs),
+        "new_jobs": len(new_jobs),
+        "repeat": repeat,
+        "total_ms": elapsed * 1000,
+        "per_replay_us": elapsed / repeat * 1e6,
+    }
+
+
+def import_profile(module: str) -> Tuple[float, List[Tuple[float, str]]]:
+    """Import a module in a fresh interpreter; return (total ms, [(cumulative ms, name)])
+
+    The total is the sum of cumulative times of top-level imports made after
+    interpreter startup, i.e. the cost of the import itself.
+    """
+    # The marker separates interpreter startup imports (site, encodings) from ours
+    code = f"import sys; print({IMPORT_MARKER!r}, file=sys.stderr, flush=True); import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd()
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    total_us = 0
+    lines = result.stderr.splitlines()
+    for line in lines[lines.index(IMPORT_MARKER) + 1:]:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        cumulative_us = int(cumulative)
+        entries.append((cumulative_us / 1000, name.strip()))
+        # Top-level imports have no indentation after the separator
+        if not name.startswith("  "):
+            total_us += cumulative_us
+
+    entries.sort(reverse=True)
+    return total_us / 1000, entries
@@ -0,0 +1,164 @@
+"""
+Command line interface for the OpenAI Careers Job Scraper
+
+    python -m ez_apply run [--fixture FILE [--notify]]  one-shot scrape and notify
+    python -m ez_apply daemon [--time HH:MM]            run daily on a schedule
+    python -m ez_apply check [TITLE ...]                inspect the seen-jobs store
+    python -m ez_apply bench [--imports]                replay a fixture / profile imports
+
+`--config PATH` (or $EZ_APPLY_CONFIG) points at config.py and may be given
+before or after the subcommand; otherwise ./config.py is used, with a
+warning if it is missing.
+
+Subcommands import what they need inside their handlers, so `check` and
+`bench` never load selenium, webdriver_manager, requests or bs4.
+"""
+
+import argparse
+import logging
+import sys
+from typing import List
+
+from ez_apply import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(level: str = None, log_file: str = None):
+    """Log to stdout, and to log_file when given; warn if running without config.py"""
+    handlers = [logging.StreamHandler(sys.stdout)]  # Explicitly use stdout
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+    logging.basicConfig(
+        level=getattr(logging, level or settings.LOG_LEVEL),
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+    if settings.CONFIG_FILE is None:
+        logger.warning(
+            "No config.py found in the current directory; using built-in defaults "
+            "(no webhook, no AVOID_KEYWORDS). Pass --config or set "
+            f"{settings.CONFIG_ENV_VAR} to use your configuration."
+        )
+
+
+def cmd_run(args) -> int:
+    """Scrape once and send notifications"""
+    setup_logging(log_file=settings.LOG_FILE)
+    from ez_apply.scraper import run_once
+
+    run_once(fixture_file=args.fixture, notify=args.notify)
+    return 0
+
+
+def cmd_daemon(args) -> int:
+    """Run the scraper every day at the scheduled time"""
+    setup_logging(level="INFO", log_file=settings.resolve("scheduler.log"))
+    from ez_apply.daemon import run_daemon
+
+    run_daemon(args.time or settings.SCHEDULE_TIME, run_immediately=not args.no_initial_run)
+    return 0
+
+
+def cmd_check(args) -> int:
+    """Report the seen-jobs store; with titles, exit 1 if any of them is unseen"""
+    setup_logging(level="WARNING")
+    from ez_apply.store import load_known_titles
+
+    data_file = args.data_file or settings.DATA_FILE
+    known_titles = load_known_titles(data_file)
+
+    if not args.titles:
+        print(f"{len(known_titles)} known jobs in {data_file}")
+        if args.list:
+            for title in sorted(known_titles):
+                print(f"  {title}")
+        return 0
+
+    unseen = 0
+    for title in args.titles:
+        if title in known_titles:
+            print(f"seen:   {title}")
+        else:
+            print(f"unseen: {title}")
+            unseen += 1
+    return 1 if unseen else 0
+
+
+def cmd_bench(args) -> int:
+    """Replay a fixture through the filter, and optionally profile import times"""
+    setup_logging(level="WARNING")
+    from ez_apply import bench
+
+    fixture = args.fixture or settings.resolve("sample_jobs.json")
+    stats = bench.replay_fixture(fixture, repeat=args.repeat)
+    print(f"Fixture replay: {stats['jobs']} jobs, {stats['new_jobs']} new, "
+          f"{stats['repeat']} runs in {stats['total_ms']:.1f} ms "
+          f"({stats['per_replay_us']:.1f} us/run)")
+
+    if args.imports:
+        print("\nCold import time (python -X importtime, excluding interpreter startup):")
+        for label, module in bench.IMPORT_TARGETS:
+            try:
+                total_ms, entries = bench.import_profile(module)
+            except RuntimeError as e:
+                print(f"  {label:<20} unavailable ({e})")
+                continue
+            print(f"  {label:<20} {total_ms:8.1f} ms  [{module}]")
+            for cumulative_ms, name in entries[:args.top]:
+                print(f"      {cumulative_ms:8.1f} ms  {name}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ez-apply",
+        description="Monitor OpenAI careers for relevant jobs and send notifications"
+    )
+    config_help = f"path to config.py (default: ${settings.CONFIG_ENV_VAR}, then ./config.py)"
+    parser.add_argument("--config", help=config_help)
+    # Also accepted after the subcommand; SUPPRESS keeps a top-level value from being reset
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", default=argparse.SUPPRESS, help=config_help)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", parents=[common], help="scrape once and send notifications")
+    run.add_argument("--fixture",
+                     help="dry run on a JSON fixture instead of the careers page; "
+                          "known jobs are not saved")
+    run.add_argument("--notify", action="store_true",
+                     help="with --fixture, still send notifications to the configured sinks")
+    run.set_defaults(func=cmd_run)
+
+    daemon = subparsers.add_parser("daemon", parents=[common], help="run the scraper daily on a schedule")
+    daemon.add_argument("--time", help="daily run time, HH:MM (default: SCHEDULE_TIME)")
+    daemon.add_argument("--no-initial-run", action="store_true",
+                        help="wait for the first scheduled time instead of running on startup")
+    daemon.set_defaults(func=cmd_daemon)
+
+    check = subparsers.add_parser("check", parents=[common], help="inspect the seen-jobs store")
+    check.add_argument("titles", nargs="*", help="job titles to look up")
+    check.add_argument("--list", action="store_true", help="print every known job title")
+    check.add_argument("--data-file", help="seen-jobs pickle file (default: DATA_FILE)")
+    check.set_defaults(func=cmd_check)
+
+    bench = subparsers.add_parser("bench", parents=[common], help="replay a fixture and profile import times")
+    bench.add_argument("--fixture",
+                       help="JSON fixture to replay (default: sample_jobs.json next to config.py)")
+    bench.add_argument("--repeat", type=int, default=1000, help="number of replays")
+    bench.add_argument("--imports", action="store_true", help="also profile cold import times")
+    bench.add_argument("--top", type=int, default=5, help="heaviest imports to list per target")
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv: List[str] = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        settings.load(args.config)
+    except (FileNotFoundError, ValueError) as e:
+        parser.error(str(e))
+    sys.exit(args.func(args))
@@ -0,0 +1,128 @@
+"""
+Daily Job Scraper Scheduler
+Runs the OpenAI careers scraper once per day at a specified time.
+Each run is a separate `python -m ez_apply run` process, so the
+long-lived daemon never loads selenium itself.
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import List
+
+from ez_apply import settings
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_TIMEOUT = 300  # Seconds allowed for one scraper run, output included
+
+
+def scraper_command() -> List[str]:
+    """Command for one scraper run, using the daemon's config.py"""
+    command = [sys.executable, '-m', 'ez_apply']
+    if settings.CONFIG_FILE:
+        command += ['--config', settings.CONFIG_FILE]
+    command.append('run')
+    return command
+
+
+def _kill(process: subprocess.Popen):
+    """Kill the scraper and anything it started (e.g. chromedriver holding the pipe open)"""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_scraper(command: List[str] = None, timeout: float = SCRAPER_TIMEOUT) -> bool:
+    """Run the job scraper; return True if it completed successfully
+
+    The timeout covers the whole run, including reading its output, so a
+    scraper that hangs while still holding stdout open is killed too.
+    """
+    try:
+        logger.info("Starting scheduled job scraper run...")
+        
+        # Run the scraper with real-time output
+        logger.info("Starting scraper subprocess...")
+        process = subprocess.Popen(
+            command or scraper_command(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            universal_newlines=True,
+            start_new_session=hasattr(os, 'killpg')
+        )
+
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            _kill(process)
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        
+        # Read output in real-time; the timer kills the process if it overruns
+        try:
+            for line in process.stdout:
+                logger.info(f"SCRAPER: {line.strip()}")
+            process.wait()
+        except BaseException:
+            # The scraper has its own session, so Ctrl+C in the daemon does not
+            # reach it; kill it here rather than leaving it orphaned
+            if process.poll() is None:
+                logger.info("Stopping job scraper...")
+                _kill(process)
+                process.wait()
+            raise
+        finally:
+            timer.cancel()
+
+        if timed_out.is_set():
+            logger.error(f"Job scraper timed out after {timeout:g} seconds")
+            return False
+        if process.returncode == 0:
+            logger.info("Job scraper completed successfully")
+            return True
+        logger.error(f"Job scraper failed with return code {process.returncode}")
+                
+    except Exception as e:
+        logger.error(f"Error running job scraper: {e}")
+    return False
+
+
+def run_daemon(schedule_time: str, run_immediately: bool = True):
+    """Main scheduler loop"""
+    import schedule
+
+    logger.info("Starting job scraper scheduler...")
+    
+    # Schedule the job to run daily at the configured time
+    schedule.every().day.at(schedule_time).do(run_scraper)
+    
+    # Also run once immediately on startup
+    if run_immediately:
+        logger.info("Running initial scraper check...")
+        run_scraper()
+    
+    logger.info("Scheduler running. Press Ctrl+C to stop.")
+    logger.info(f"Next scheduled run: {schedule_time} daily")
+    
+    try:
+        while True:
+            schedule.run_pending()
+            time.sleep(60)  # Check every minute
+    except KeyboardInterrupt:
+        logger.info("Scheduler stopped by user")
+    except Exception as e:
+        logger.error(f"Scheduler error: {e}")
@@ -0,0 +1,460 @@
+"""
+Notification sinks for the OpenAI Careers Job Scraper
+Each sink delivers a batch of new job postings to one destination
+(Discord, Slack-compatible webhook, SMTP email, local JSONL file).
+The dispatcher fans every batch out to all sinks concurrently, with a
+per-sink timeout, retry policy and circuit breaker.
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from ez_apply.store import load_breaker_states, save_breaker_states
+
+logger = logging.getLogger(__name__)
+
+BOT_USERNAME = "OpenAI Job Bot"
+FOOTER_TEXT = "OpenAI Careers Job Scraper"
+NO_NEW_JOBS_TEXT = "No new relevant job postings were found in the latest scan."
+
+# Discord accepts at most 10 embeds per webhook message
+DISCORD_MAX_EMBEDS = 10
+
+
+@dataclass
+class RetryPolicy:
+    """How many times to attempt a delivery and how long to back off between attempts"""
+    attempts: int = 3
+    backoff: float = 1.0
+    multiplier: float = 2.0
+    max_backoff: float = 30.0
+
+    def delays(self) -> List[float]:
+        """Sleep durations between consecutive attempts"""
+        delays = []
+        delay = self.backoff
+        for _ in range(max(self.attempts - 1, 0)):
+            delays.append(min(delay, self.max_backoff))
+            delay *= self.multiplier
+        return delays
+
+
+class CircuitBreaker:
+    """Stops calling a sink after repeated failures until a cool-down has passed
+
+    Uses wall-clock time so the state can be saved with snapshot() and
+    restored in the next run, since every scheduled run is a new process.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.time() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Return True if a call may go through (closed, or half-open trial)"""
+        with self._lock:
+            return self._state() != self.OPEN
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            # A failed half-open trial re-opens the breaker for another cool-down
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.time()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {"failures": self.failures, "opened_at": self.opened_at}
+
+    def restore(self, state: Dict):
+        with self._lock:
+            self.failures = state.get("failures", 0)
+            self.opened_at = state.get("opened_at")
+
+
+class NotificationSink:
+    """Base class for a notification destination
+
+    Subclasses implement deliver(payload), and may override build_payloads(jobs)
+    to split a batch into several messages; each payload is retried on its own,
+    so a retry never repeats a message that was already delivered. An empty
+    batch means the scan found no new jobs, which sinks report as a
+    "No New Jobs" message.
+    """
+
+    name = "sink"
+
+    def __init__(self, timeout: float = 10, retry: RetryPolicy = None,
+                 breaker: CircuitBreaker = None, name: str = None):
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        if name:
+            self.name = name
+
+    def build_payloads(self, jobs: Sequence) -> List:
+        """Split a batch into the messages to deliver (the whole batch by default)"""
+        return [jobs]
+
+    def deliver(self, payload):
+        """Deliver one payload; raise on failure"""
+        raise NotImplementedError
+
+    def deadline(self, jobs: Sequence) -> float:
+        """Worst-case wall time for send(jobs), used by the dispatcher as its wait budget"""
+        per_payload = self.timeout * self.retry.attempts + sum(self.retry.delays())
+        return per_payload * len(self.build_payloads(jobs))
+
+    def _deliver_with_retry(self, payload) -> bool:
+        delays = self.retry.delays()
+        for attempt in range(1, self.retry.attempts + 1):
+            try:
+                self.deliver(payload)
+                return True
+            except Exception as e:
+                logger.error(f"[{self.name}] Attempt {attempt}/{self.retry.attempts} failed: {e}")
+                if attempt <= len(delays):
+                    time.sleep(delays[attempt - 1])
+        return False
+
+    def send(self, jobs: Sequence) -> bool:
+        """Deliver a batch with per-payload retries, honouring the circuit breaker"""
+        if not self.breaker.allow():
+            logger.warning(f"[{self.name}] Circuit open, skipping notification")
+            return False
+
+        payloads = self.build_payloads(jobs)
+        for index, payload in enumerate(payloads, 1):
+            if not self._deliver_with_retry(payload):
+                logger.error(f"[{self.name}] Gave up on message {index}/{len(payloads)}")
+                break
+        else:
+            self.breaker.record_success()
+            logger.info(f"[{self.name}] Notification sent for {len(jobs)} job(s)")
+            return True
+
+        self.breaker.record_failure()
+        return False
+
+    def close(self):
+        """Release any connections held by the sink"""
+
+
+class WebhookSink(NotificationSink):
+    """Sink that POSTs a JSON payload to a webhook URL"""
+
+    name = "webhook"
+
+    def __init__(self, url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url
+        self._session = None
+
+    @property
+    def session(self):
+        """HTTP session, created (and requests imported) on first delivery"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def build_payloads(self, jobs: Sequence) -> List[Dict]:
+        raise NotImplementedError
+
+    def deliver(self, payload: Dict):
+        response = self.session.post(
+            self.url,
+            json=payload,
+            headers={'Content-Type': 'application/json'},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+
+class DiscordWebhookSink(WebhookSink):
+    """Discord webhook with one rich embed per job"""
+
+    name = "discord"
+
+    def build_payloads(self, jobs: Sequence) -> List[Dict]:
+        timestamp = datetime.utcnow().isoformat()
+        if not jobs:
+            return [{
+                "embeds": [{
+                    "title": "No New Jobs",
+                    "description": NO_NEW_JOBS_TEXT,
+                    "color": 0x808080,
+                    "timestamp": timestamp,
+                    "footer": {
+                        "text": FOOTER_TEXT
+                    }
+                }],
+                "username": BOT_USERNAME,
+            }]
+
+        embeds = [
+            {
+                "title": "🔌 New Job at OpenAI!",
+                "description": f"**{job.title}**",
+                "url": job.careerLink,
+                "color": 0x00ff00,  # Green color
+                "fields": [
+                    {
+                        "name": "🔗 Apply Now",
+                        "value": f"[Click here to apply]({job.applyLink})",
+                        "inline": False
+                    }
+                ],
+                "timestamp": timestamp
+            }
+            for job in jobs
+        ]
+        return [
+            {"embeds": embeds[i:i + DISCORD_MAX_EMBEDS], "username": BOT_USERNAME}
+            for i in range(0, len(embeds), DISCORD_MAX_EMBEDS)
+        ]
+
+
+class SlackWebhookSink(WebhookSink):
+    """Slack-compatible incoming webhook (plain mrkdwn text)"""
+
+    name = "slack"
+
+    def build_payloads(self, jobs: Sequence) -> List[Dict]:
+        if not jobs:
+            return [{"text": f"*No New Jobs*\n{NO_NEW_JOBS_TEXT}"}]
+
+        lines = [f"*🔌 {len(jobs)} new job(s) at OpenAI!*"]
+        for job in jobs:
+            lines.append(f"• <{job.careerLink}|{job.title}> (<{job.applyLink}|apply>)")
+        return [{"text": "\n".join(lines)}]
+
+
+class EmailSink(NotificationSink):
+    """Plain-text email digest over SMTP"""
+
+    name = "email"
+
+    def __init__(self, host: str, port: int, sender: str, recipients: List[str],
+                 username: str = None, password: str = None, use_tls: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = list(recipients)
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+
+    def build_message(self, jobs: Sequence):
+        from email.message import EmailMessage
+
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        if jobs:
+            message["Subject"] = f"{len(jobs)} new job(s) at OpenAI"
+            body = "\n\n".join(
+                f"{job.title}\nApply: {job.applyLink}\nCareer Page: {job.careerLink}"
+                for job in jobs
+            )
+        else:
+            message["Subject"] = "No New Jobs"
+            body = NO_NEW_JOBS_TEXT
+        message.set_content(f"{body}\n\n-- {FOOTER_TEXT}\n")
+        return message
+
+    def deliver(self, jobs: Sequence):
+        import smtplib
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(self.build_message(jobs))
+
+
+class JsonlFileSink(NotificationSink):
+    """Appends one JSON record per job (or a no-new-jobs marker) to a local file"""
+
+    name = "file"
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def deliver(self, jobs: Sequence):
+        timestamp = datetime.utcnow().isoformat()
+        if jobs:
+            records = [
+                {"event": "new_job", "timestamp": timestamp, "title": job.title,
+                 "applyLink": job.applyLink, "careerLink": job.careerLink}
+                for job in jobs
+            ]
+        else:
+            records = [{"event": "no_new_jobs", "timestamp": timestamp}]
+
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+
+class NotificationDispatcher:
+    """Fans each batch out to all sinks concurrently
+
+    dispatch() waits at most for the slowest sink's deadline. Each send runs
+    on a daemon thread, so a hung destination is abandoned at its deadline
+    and never keeps the process alive at exit; missing the deadline counts
+    as a failure for the sink's circuit breaker. Within one process, a sink
+    that is still busy with an earlier batch is skipped.
+
+    Each scheduled run is a separate process, so when state_file is given
+    the circuit breaker states are loaded from it on start-up and saved
+    after every batch.
+    """
+
+    def __init__(self, sinks: Sequence[NotificationSink] = (), state_file: str = None):
+        self.sinks = list(sinks)
+        self.state_file = state_file
+        self._in_flight: Dict[str, Future] = {}
+        if state_file:
+            states = load_breaker_states(state_file)
+            for sink in self.sinks:
+                if sink.name in states:
+                    sink.breaker.restore(states[sink.name])
+
+    @staticmethod
+    def _start(sink: NotificationSink, jobs: List) -> Future:
+        """Run sink.send on a daemon thread, exposing its outcome as a Future"""
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(sink.send(jobs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"notify-{sink.name}", daemon=True).start()
+        return future
+
+    def dispatch(self, jobs: Sequence) -> Dict[str, bool]:
+        """Send a batch to every sink; return {sink name: delivered}"""
+        if not self.sinks:
+            logger.warning("No notification sinks configured, skipping notification")
+            return {}
+
+        submitted = {}
+        results = {}
+        sinks_by_name = {sink.name: sink for sink in self.sinks}
+        for sink in self.sinks:
+            previous = self._in_flight.get(sink.name)
+            if previous is not None and not previous.done():
+                logger.warning(f"[{sink.name}] Previous notification still in flight, skipping")
+                results[sink.name] = False
+                continue
+            future = self._start(sink, list(jobs))
+            self._in_flight[sink.name] = future
+            submitted[sink.name] = (future, time.monotonic() + sink.deadline(jobs))
+
+        for name, (future, deadline_at) in submitted.items():
+            try:
+                results[name] = future.result(timeout=max(deadline_at - time.monotonic(), 0))
+            except FutureTimeoutError:
+                logger.error(f"[{name}] Notification did not finish in time, not waiting for it")
+                sinks_by_name[name].breaker.record_failure()
+                results[name] = False
+            except Exception as e:
+                logger.error(f"[{name}] Notification failed: {e}")
+                results[name] = False
+
+        if self.state_file:
+            save_breaker_states(self.state_file, {
+                sink.name: sink.breaker.snapshot() for sink in self.sinks
+            })
+        return results
+
+    def close(self):
+        """Release sink connections; sends still in flight are abandoned, not awaited"""
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error(f"[{sink.name}] Error closing sink: {e}")
+
+
+def build_sinks(discord_webhook_url: str = None, slack_webhook_url: str = None,
+                smtp_host: str = None, smtp_port: int = 587, smtp_username: str = None,
+                smtp_password: str = None, smtp_use_tls: bool = True, email_from: str = None,
+                email_to: List[str] = None, jsonl_file: str = None, timeout: float = 10,
+                retry_attempts: int = 3, breaker_threshold: int = 3,
+                breaker_reset: float = 12 * 3600,
+                overrides: Dict[str, Dict] = None) -> List[NotificationSink]:
+    """Create a sink for every destination that has been configured
+
+    timeout, retry_attempts, breaker_threshold and breaker_reset apply to
+    every sink unless overrides gives a value for that sink, keyed by sink
+    name, e.g. {"email": {"timeout": 30}}.
+    """
+    overrides = overrides or {}
+
+    def policy(name: str):
+        values = dict(timeout=timeout, retry_attempts=retry_attempts,
+                      breaker_threshold=breaker_threshold, breaker_reset=breaker_reset)
+        values.update(overrides.get(name, {}))
+        return dict(
+            timeout=values["timeout"],
+            retry=RetryPolicy(attempts=values["retry_attempts"]),
+            breaker=CircuitBreaker(values["breaker_threshold"], values["breaker_reset"])
+        )
+
+    sinks: List[NotificationSink] = []
+    if discord_webhook_url:
+        sinks.append(DiscordWebhookSink(discord_webhook_url, **policy(DiscordWebhookSink.name)))
+    if slack_webhook_url:
+        sinks.append(SlackWebhookSink(slack_webhook_url, **policy(SlackWebhookSink.name)))
+    if smtp_host and email_from and email_to:
+        sinks.append(EmailSink(
+            smtp_host, smtp_port, email_from, email_to,
+            username=smtp_username, password=smtp_password, use_tls=smtp_use_tls,
+            **policy(EmailSink.name)
+        ))
+    if jsonl_file:
+        sinks.append(JsonlFileSink(jsonl_file, **policy(JsonlFileSink.name)))
+    return sinks
@@ -0,0 +1,394 @@
+"""
+OpenAI Careers Job Scraper
+Monitors OpenAI careers website for electrical engineering positions
+and sends notifications for new job postings.
+"""
+
+import json
+import time
+from typing import List, Dict, Set
+import logging
+from dataclasses import dataclass
+
+from ez_apply import settings
+from ez_apply.notifiers import NotificationDispatcher, build_sinks
+from ez_apply.store import load_known_titles, save_known_titles
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class JobPosting:
+    """Data class for job posting information"""
+    title: str
+    applyLink: str
+    careerLink: str
+
+class OpenAICareersScraper:
+    """Scraper for OpenAI careers website"""
+    
+    def __init__(self, discord_webhook_url: str = None, dispatcher: NotificationDispatcher = None):
+        self.base_url = settings.OPENAI_CAREERS_URL
+        self.discord_webhook_url = discord_webhook_url
+        # A dispatcher created here is owned by the scraper and released by close()
+        self._owns_dispatcher = dispatcher is None
+        self.dispatcher = dispatcher or NotificationDispatcher(build_sinks(
+            discord_webhook_url=discord_webhook_url,
+            timeout=settings.NOTIFY_TIMEOUT,
+            retry_attempts=settings.NOTIFY_RETRY_ATTEMPTS,
+            breaker_threshold=settings.NOTIFY_BREAKER_THRESHOLD,
+            breaker_reset=settings.NOTIFY_BREAKER_RESET
+        ))
+        self.data_file = settings.DATA_FILE
+        self.known_job_titles: Set[str] = set()
+        self.load_known_jobs()
+        
+        # Keywords for electrical engineering positions
+        self.target_keywords = settings.TARGET_KEYWORDS
+        
+        # Headers to mimic a real browser
+        self.headers = {
+            'User-Agent': settings.USER_AGENT,
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+
+    def close(self):
+        """Release the notification dispatcher if the scraper created it"""
+        if self._owns_dispatcher:
+            self.dispatcher.close()
+
+    def load_known_jobs(self):
+        """Load previously seen job IDs from pickle file"""
+        self.known_job_titles = load_known_titles(self.data_file)
+
+    def save_known_jobs(self):
+        """Save known job IDs to pickle file"""
+        save_known_titles(self.data_file, self.known_job_titles)
+
+    def fetch_jobs(self) -> List[Dict]:
+        """Fetch all jobs from OpenAI careers search page using Selenium"""
+        try:
+            logger.info("Fetching jobs from OpenAI careers search page...")
+
+            # Selenium is only needed here, so it is imported on first use
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.common.exceptions import WebDriverException
+            
+            # Set up Chrome options
+            chrome_options = Options()
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument(f"--user-agent={settings.USER_AGENT}")
+            
+            driver = None
+            try:
+                # Initialize the Chrome driver
+                logger.info("Initializing Chrome driver...")
+                driver = webdriver.Chrome(options=chrome_options)
+                
+                # Navigate to the careers page
+                careers_url = "https://openai.com/careers/search/"
+                logger.info(f"Navigating to {careers_url}")
+                driver.get(careers_url)
+                
+                # Wait for the page to load
+                time.sleep(5)
+                
+                # Get the page source
+                page_source = driver.page_source
+                
+                # Look for the embedded JSON data
+                # The jobs data is embedded in a script tag with window.__NEXT_DATA__
+                import re
+                
+                # Extract jobs using href patterns
+                # Look for career links: href="/careers/..." -> job title
+                # Look for apply links: href="https://jobs..." -> job application link
+                
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(page_source, 'html.parser')
+                
+                jobs = []
+                
+                # Find all links with href="/careers/..."
+                career_links = soup.find_all('a', href=lambda x: x and x.startswith('/careers/'))
+                
+                for career_link in career_links:
+                    job_title = career_link.get_text(strip=True)
+                    career_href = career_link.get('href')
+                    
+                    if job_title and career_href:
+                        # Look for corresponding application link
+                        # Try to find a nearby link with href="https://jobs..."
+                        apply_link = None
+                        
+                        # Look in the same parent container for the apply link
+                        parent = career_link.parent
+                        if parent:
+                            apply_links = parent.find_all('a', href=lambda x: x and x.startswith('https://jobs.'))
+                            if apply_links:
+                                apply_link = apply_links[0].get('href')
+                        
+                        # If not found in parent, search more broadly
+                        if not apply_link:
+                            # Look for apply links that might be related
+                            all_apply_links = soup.find_all('a', href=lambda x: x and x.startswith('https://jobs.'))
+                            # For now, we'll use the career link as the apply link if we can't find a specific one
+                            apply_link = f"https://openai.com{career_href}"
+                        
+                        job_data = {
+                            "title": job_title,
+                            "applyLink": apply_link,
+                            "careerLink": f"https://openai.com{career_href}"
+                        }
+                        jobs.append(job_data)
+                
+                if jobs:
+                    logger.info(f"Successfully extracted {len(jobs)} jobs using href patterns")
+                    return jobs
+                
+                # If the above pattern didn't work, try a more flexible approach
+                # Look for any JSON-like structure containing job data
+                json_pattern = r'window\.__NEXT_DATA__\s*=\s*({.*?});'
+                match = re.search(json_pattern, page_source, re.DOTALL)
+                
+                if match:
+                    json_str = match.group(1)
+                    try:
+                        data = json.loads(json_str)
+                        
+                        # Navigate through the JSON structure to find jobs
+                        jobs = []
+                        
+                        # Try different possible paths for jobs data
+                        possible_paths = [
+                            ['props', 'pageProps', 'jobs'],
+                            ['props', 'pageProps', 'data', 'jobs'],
+                            ['props', 'pageProps', 'initialData', 'jobs'],
+                            ['props', 'pageProps', 'jobsData'],
+                            ['props', 'pageProps', 'data']
+                        ]
+                        
+                        for path in possible_paths:
+                            current = data
+                            try:
+                                for key in path:
+                                    current = current[key]
+                                if isinstance(current, list) and len(current) > 0:
+                                    jobs = current
+                                    logger.info(f"Found {len(jobs)} jobs using path: {path}")
+                                    break
+                            except (KeyError, TypeError):
+                                continue
+                        
+                        if not jobs:
+                            # If we can't find jobs in the expected structure, 
+                            # let's look for any array that contains job-like objects
+                            def find_jobs_recursive(obj, depth=0):
+                                if depth > 5:  # Prevent infinite recursion
+                                    return None
+                                
+                                if isinstance(obj, list) and len(obj) > 0:
+                                    # Check if this looks like a jobs array
+                                    first_item = obj[0]
+                                    if isinstance(first_item, dict):
+                                        # Look for job-like fields
+                                        job_fields = ['title', 'applyLink', 'careerLink']
+                                        if any(field in first_item for field in job_fields):
+                                            return obj
+                                
+                                if isinstance(obj, dict):
+                                    for key, value in obj.items():
+                                        result = find_jobs_recursive(value, depth + 1)
+                                        if result:
+                                            return result
+                                
+                                return None
+                            
+                            jobs = find_jobs_recursive(data) or []
+                            
+                            if jobs:
+                                logger.info(f"Found {len(jobs)} jobs using recursive search")
+                        
+                        if jobs:
+                            logger.info(f"Successfully extracted {len(jobs)} jobs from careers page")
+                            return jobs
+                        else:
+                            logger.warning("No jobs found in the page data")
+                            return []
+                            
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Failed to parse JSON data: {e}")
+                        return []
+                
+                logger.warning("Could not find job data in the page")
+                return []
+                    
+            except WebDriverException as e:
+                logger.error(f"WebDriver error: {e}")
+                return []
+            except Exception as e:
+                logger.error(f"Unexpected error during Selenium scraping: {e}")
+                return []
+            finally:
+                if driver:
+                    driver.quit()
+                    
+        except Exception as e:
+            logger.error(f"Error fetching jobs: {e}")
+            return []
+
+
+
+
+
+    def is_relevant_job(self, job: Dict) -> bool:
+        """Check if job is relevant for electrical engineering"""
+        title = job.get('title', '').lower()
+        
+        # First check if any avoid keyword is in the title (if so, reject immediately)
+        for avoid_keyword in settings.AVOID_KEYWORDS:
+            if avoid_keyword.lower() in title:
+                logger.debug(f"Job '{job.get('title', '')}' rejected due to avoid keyword: '{avoid_keyword}'")
+                return False
+        
+        # Then check if any target keyword is in the title
+        for keyword in self.target_keywords:
+            if keyword in title:
+                logger.debug(f"Job '{job.get('title', '')}' accepted due to target keyword: '{keyword}'")
+                return True
+        
+        return False
+
+    def parse_job(self, job_data: Dict) -> JobPosting:
+        """Parse job data into JobPosting object"""
+        return JobPosting(
+            title=job_data.get('title', ''),
+            applyLink=job_data.get('applyLink', ''),
+            careerLink=job_data.get('careerLink', '')
+        )
+
+    def notify(self, jobs: List[JobPosting]) -> Dict[str, bool]:
+        """Send a batch of new jobs to every configured sink (empty batch = no new jobs)"""
+        return self.dispatcher.dispatch(jobs)
+
+    def load_fixture_jobs(self, path: str) -> List[Dict]:
+        """Load raw job data from a JSON fixture instead of the careers page"""
+        with open(path, 'r', encoding='utf-8') as f:
+            jobs = json.load(f)
+        logger.info(f"Loaded {len(jobs)} jobs from fixture {path}")
+        return jobs
+
+    def find_new_jobs(self, all_jobs: List[Dict]) -> List[JobPosting]:
+        """Filter relevant jobs and return the ones not seen before
+
+        Jobs are not marked as seen here; see scrape_and_notify().
+        """
+        # Filter for relevant jobs
+        relevant_jobs = [job for job in all_jobs if self.is_relevant_job(job)]
+        logger.info(f"Found {len(relevant_jobs)} relevant electrical engineering jobs")
+
+        # Check for new jobs
+        new_jobs = []
+        new_titles = set()
+        for job_data in relevant_jobs:
+            job_title = job_data.get('title', '')
+            if job_title not in self.known_job_titles and job_title not in new_titles:
+                job = self.parse_job(job_data)
+                new_jobs.append(job)
+                new_titles.add(job_title)
+                logger.info(f"New job found: {job.title}")
+            else:
+                logger.info(f"Job already seen: {job_title}")
+        return new_jobs
+
+    def scrape_and_notify(self, all_jobs: List[Dict] = None, save: bool = True):
+        """Main scraping function; pass all_jobs to skip fetching (e.g. a fixture)
+
+        With save=False the seen-jobs store is left untouched.
+        """
+        logger.info("Starting job scraping process...")
+        
+        # Fetch all jobs
+        if all_jobs is None:
+            all_jobs = self.fetch_jobs()
+        if not all_jobs:
+            logger.error("No jobs fetched, aborting")
+            return
+
+        new_jobs = self.find_new_jobs(all_jobs)
+
+        # Send notifications for new jobs (an empty batch reports "No New Jobs")
+        if new_jobs:
+            logger.info(f"Sending notifications for {len(new_jobs)} new jobs")
+        else:
+            logger.info("No new jobs found")
+        results = self.notify(new_jobs)
+
+        # Only mark jobs as seen once some sink has delivered them, so a batch
+        # that every sink failed (or skipped) is retried on the next run.
+        # With no sinks configured there is nothing to retry.
+        if not results or any(results.values()):
+            self.known_job_titles.update(job.title for job in new_jobs)
+        elif new_jobs:
+            logger.warning(f"No sink delivered the {len(new_jobs)} new job(s); "
+                           "they will be retried on the next run")
+
+        # Save updated job IDs
+        if save:
+            self.save_known_jobs()
+        else:
+            logger.info("Not saving known jobs (replay)")
+        logger.info("Job scraping process completed")
+
+def run_once(fixture_file: str = None, notify: bool = False):
+    """Run one scrape with the notification sinks from config.py and the environment
+
+    A fixture run is a dry run: the seen-jobs store is never saved, and
+    notifications are only sent when notify is True.
+    """
+    # Every notification setting can be overridden from the environment (see settings.py)
+    discord_webhook = settings.DISCORD_WEBHOOK_URL
+    
+    if not discord_webhook:
+        logger.warning("DISCORD_WEBHOOK_URL not set. Notifications will be skipped.")
+        logger.info("To set up Discord notifications:")
+        logger.info("1. Go to your Discord server settings")
+        logger.info("2. Navigate to Integrations > Webhooks")
+        logger.info("3. Create a new webhook and copy the URL")
+        logger.info("4. Set the DISCORD_WEBHOOK_URL environment variable or update config.py")
+    
+    sinks = build_sinks(
+        discord_webhook_url=discord_webhook,
+        slack_webhook_url=settings.SLACK_WEBHOOK_URL,
+        smtp_host=settings.SMTP_HOST,
+        smtp_port=settings.SMTP_PORT,
+        smtp_username=settings.SMTP_USERNAME,
+        smtp_password=settings.SMTP_PASSWORD,
+        smtp_use_tls=settings.SMTP_USE_TLS,
+        email_from=settings.EMAIL_FROM,
+        email_to=settings.EMAIL_TO,
+        jsonl_file=settings.NOTIFY_JSONL_FILE,
+        timeout=settings.NOTIFY_TIMEOUT,
+        retry_attempts=settings.NOTIFY_RETRY_ATTEMPTS,
+        breaker_threshold=settings.NOTIFY_BREAKER_THRESHOLD,
+        breaker_reset=settings.NOTIFY_BREAKER_RESET,
+        overrides=settings.sink_overrides()
+    )
+    if fixture_file and not notify:
+        logger.info("Fixture replay: notifications disabled (pass --notify to send them)")
+        sinks = []
+    logger.info(f"Notification sinks: {', '.join(sink.name for sink in sinks) or 'none'}")
+
+    dispatcher = NotificationDispatcher(sinks, state_file=settings.NOTIFY_STATE_FILE)
+    scraper = OpenAICareersScraper(discord_webhook_url=discord_webhook, dispatcher=dispatcher)
+    try:
+        all_jobs = scraper.load_fixture_jobs(fixture_file) if fixture_file else None
+        scraper.scrape_and_notify(all_jobs, save=not fixture_file)
+    finally:
+        dispatcher.close()
@@ -0,0 +1,168 @@
+"""
+Scraper settings
+Loaded from the user-editable config.py, with built-in defaults for
+anything it does not define. Notification settings can then be
+overridden by environment variables of the same name.
+
+Nothing is read on import: the CLI calls load() after parsing its
+arguments, and library users (the test scripts) call it themselves.
+config.py is looked up at the path given to load() (the CLI's --config),
+then $EZ_APPLY_CONFIG, then the current directory. Relative file paths in
+it (DATA_FILE, LOG_FILE, ...) are resolved against its directory, so the
+installed `ez-apply` command uses the same files from anywhere.
+"""
+
+import os
+
+# Defaults used when config.py is missing or leaves a setting out
+DISCORD_WEBHOOK_URL = ''
+TARGET_KEYWORDS = [
+    'electrical',
+    'hardware',
+    'EE',
+    'circuit',
+    'robotics',
+]
+AVOID_KEYWORDS = []
+SCHEDULE_TIME = "13:00"
+REQUEST_TIMEOUT = 30
+MAX_DESCRIPTION_LENGTH = 200
+LOG_LEVEL = "INFO"
+LOG_FILE = "job_scraper.log"
+DATA_FILE = "known_jobs.pkl"
+OPENAI_CAREERS_URL = "https://openai.com/careers/search/"
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+SLACK_WEBHOOK_URL = ''
+SMTP_HOST = ''
+SMTP_PORT = 587
+SMTP_USERNAME = ''
+SMTP_PASSWORD = ''
+SMTP_USE_TLS = True
+EMAIL_FROM = ''
+EMAIL_TO = []
+NOTIFY_JSONL_FILE = ''
+NOTIFY_TIMEOUT = 10
+NOTIFY_RETRY_ATTEMPTS = 3
+NOTIFY_BREAKER_THRESHOLD = 3
+NOTIFY_BREAKER_RESET = 12 * 3600
+NOTIFY_STATE_FILE = "notify_state.pkl"
+
+# Per-sink overrides of the delivery settings above, e.g. NOTIFY_EMAIL_TIMEOUT;
+# None falls back to the global NOTIFY_* value
+SINK_NAMES = ['discord', 'slack', 'email', 'file']
+SINK_POLICY_SETTINGS = {
+    'TIMEOUT': float,
+    'RETRY_ATTEMPTS': int,
+    'BREAKER_THRESHOLD': int,
+    'BREAKER_RESET': float,
+}
+for _sink in SINK_NAMES:
+    for _setting in SINK_POLICY_SETTINGS:
+        globals()[f'NOTIFY_{_sink.upper()}_{_setting}'] = None
+
+CONFIG_ENV_VAR = "EZ_APPLY_CONFIG"
+CONFIG_FILE = None  # Absolute path of the loaded config.py, None when using defaults
+
+# Settings holding file paths, resolved relative to the config directory
+PATH_SETTINGS = ['DATA_FILE', 'LOG_FILE', 'NOTIFY_JSONL_FILE', 'NOTIFY_STATE_FILE']
+
+_DEFAULTS = {name: value for name, value in globals().items() if name.isupper()}
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _parse_list(value: str) -> list:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+# Settings read from the environment when set, with the parser for each
+ENV_OVERRIDES = {
+    'DISCORD_WEBHOOK_URL': str,
+    'SLACK_WEBHOOK_URL': str,
+    'SMTP_HOST': str,
+    'SMTP_PORT': int,
+    'SMTP_USERNAME': str,
+    'SMTP_PASSWORD': str,
+    'SMTP_USE_TLS': _parse_bool,
+    'EMAIL_FROM': str,
+    'EMAIL_TO': _parse_list,  # comma-separated addresses
+    'NOTIFY_JSONL_FILE': str,
+    'NOTIFY_TIMEOUT': float,
+    'NOTIFY_RETRY_ATTEMPTS': int,
+    'NOTIFY_BREAKER_THRESHOLD': int,
+    'NOTIFY_BREAKER_RESET': float,
+    'NOTIFY_STATE_FILE': str,
+}
+ENV_OVERRIDES.update({
+    f'NOTIFY_{sink.upper()}_{setting}': parse
+    for sink in SINK_NAMES
+    for setting, parse in SINK_POLICY_SETTINGS.items()
+})
+
+
+def apply_env_overrides():
+    """Replace settings with their environment variables, where set
+
+    Raises ValueError naming the variable when a value cannot be parsed.
+    """
+    for name, parse in ENV_OVERRIDES.items():
+        value = os.getenv(name)
+        if value:
+            try:
+                globals()[name] = parse(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for environment variable {name}: {value!r}") from None
+
+
+def sink_overrides() -> dict:
+    """Per-sink delivery settings that are set, e.g. {'email': {'timeout': 30.0}}"""
+    overrides = {}
+    for sink in SINK_NAMES:
+        for setting in SINK_POLICY_SETTINGS:
+            value = globals()[f'NOTIFY_{sink.upper()}_{setting}']
+            if value is not None:
+                overrides.setdefault(sink, {})[setting.lower()] = value
+    return overrides
+
+
+def find_config(path: str = None):
+    """Return the config.py to load, or None if there is none"""
+    path = path or os.getenv(CONFIG_ENV_VAR)
+    if path:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Config file not found: {path}")
+        return os.path.abspath(path)
+    if os.path.isfile('config.py'):
+        return os.path.abspath('config.py')
+    return None
+
+
+def resolve(path: str) -> str:
+    """Resolve a relative path against the config directory (or the current directory)"""
+    if not path or os.path.isabs(path):
+        return path
+    base = os.path.dirname(CONFIG_FILE) if CONFIG_FILE else os.getcwd()
+    return os.path.join(base, path)
+
+
+def load(path: str = None):
+    """(Re)load settings: defaults, then config.py, then environment overrides
+
+    Raises FileNotFoundError for a missing explicit config file and
+    ValueError for an unparseable environment override.
+    """
+    import runpy
+
+    global CONFIG_FILE
+    namespace = globals()
+    namespace.update(_DEFAULTS)
+    CONFIG_FILE = find_config(path)
+    if CONFIG_FILE:
+        config = runpy.run_path(CONFIG_FILE)
+        namespace.update({name: value for name, value in config.items() if name.isupper()})
+    apply_env_overrides()
+    for name in PATH_SETTINGS:
+        namespace[name] = resolve(namespace[name])
+    return CONFIG_FILE
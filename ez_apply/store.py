@@ -0,0 +1,56 @@
+"""
+Seen-jobs store
+Job titles that have already been notified are kept in a pickle file,
+and so are the notification sinks' circuit breaker states.
+"""
+
+import logging
+import os
+import pickle
+from typing import Dict, Set
+
+logger = logging.getLogger(__name__)
+
+
+def load_known_titles(path: str) -> Set[str]:
+    """Load previously seen job titles from pickle file"""
+    try:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                titles = pickle.load(f)
+            logger.info(f"Loaded {len(titles)} known job IDs")
+            return titles
+        logger.info("No existing job data found, starting fresh")
+    except Exception as e:
+        logger.error(f"Error loading known jobs: {e}")
+    return set()
+
+
+def save_known_titles(path: str, titles: Set[str]):
+    """Save known job titles to pickle file"""
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump(titles, f)
+        logger.info(f"Saved {len(titles)} job IDs to {path}")
+    except Exception as e:
+        logger.error(f"Error saving known jobs: {e}")
+
+
+def load_breaker_states(path: str) -> Dict[str, Dict]:
+    """Load circuit breaker states keyed by sink name from pickle file"""
+    try:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+    except Exception as e:
+        logger.error(f"Error loading notification state: {e}")
+    return {}
+
+
+def save_breaker_states(path: str, states: Dict[str, Dict]):
+    """Save circuit breaker states keyed by sink name to pickle file"""
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump(states, f)
+    except Exception as e:
+        logger.error(f"Error saving notification state: {e}")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test the ez_apply command line interface
+Checks that non-browser commands work and never import the heavy
+scraping dependencies.
+"""
+
+import os
+import pickle
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from ez_apply import bench, settings
+from ez_apply.cli import build_parser
+from test_notifiers import FakeWebhookServer
+
+HEAVY_MODULES = ["selenium", "webdriver_manager", "requests", "bs4"]
+
+
+def run_cli(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "ez_apply", *args],
+        capture_output=True,
+        text=True
+    )
+
+
+def test_check_does_not_import_heavy_dependencies():
+    code = (
+        "import sys\n"
+        "from ez_apply.cli import main\n"
+        "try:\n"
+        "    main(['check'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_check_reports_seen_and_unseen_titles():
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, "known_jobs.pkl")
+        with open(data_file, 'wb') as f:
+            pickle.dump({"Electrical Engineer"}, f)
+
+        result = run_cli("check", "--data-file", data_file)
+        assert result.returncode == 0
+        assert "1 known jobs" in result.stdout
+
+        result = run_cli("check", "--data-file", data_file, "Electrical Engineer")
+        assert result.returncode == 0
+        assert "seen:   Electrical Engineer" in result.stdout
+
+        result = run_cli("check", "--data-file", data_file, "Electrical Engineer", "Hardware Engineer")
+        assert result.returncode == 1
+        assert "unseen: Hardware Engineer" in result.stdout
+
+
+def test_run_fixture_is_a_dry_run():
+    server = FakeWebhookServer()
+    fixture = os.path.abspath("sample_jobs.json")
+    env = dict(os.environ, DISCORD_WEBHOOK_URL=server.url,
+               PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = subprocess.run(
+                [sys.executable, "-m", "ez_apply", "run", "--fixture", fixture],
+                capture_output=True, text=True, cwd=tmp, env=env
+            )
+            assert result.returncode == 0, result.stderr
+            assert "New job found" in result.stdout
+            assert not os.path.exists(os.path.join(tmp, "known_jobs.pkl"))
+        assert server.payloads == []
+    finally:
+        server.close()
+
+
+def test_bench_replays_fixture():
+    stats = bench.replay_fixture("sample_jobs.json", repeat=10)
+    assert stats["jobs"] > 0
+    assert stats["new_jobs"] > 0
+    assert stats["repeat"] == 10
+
+
+def test_import_profile_excludes_interpreter_startup():
+    total_ms, entries = bench.import_profile("ez_apply.store")
+    names = [name for _, name in entries]
+    assert "ez_apply.store" in names
+    assert "site" not in names
+    assert total_ms > 0
+
+
+def test_notification_settings_read_from_environment():
+    env = dict(os.environ, SMTP_PORT="2525", EMAIL_FROM="bot@example.com",
+               EMAIL_TO="a@example.com, b@example.com", NOTIFY_JSONL_FILE="out.jsonl")
+    code = ("from ez_apply import settings as s; s.load(); "
+            "print(repr((s.SMTP_PORT, s.EMAIL_FROM, s.EMAIL_TO, s.NOTIFY_JSONL_FILE)))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == repr(
+        (2525, "bot@example.com", ["a@example.com", "b@example.com"], os.path.abspath("out.jsonl")))
+
+
+def test_per_sink_settings_read_from_environment():
+    env = dict(os.environ, NOTIFY_EMAIL_TIMEOUT="30", NOTIFY_DISCORD_RETRY_ATTEMPTS="5")
+    code = "from ez_apply import settings as s; s.load(); print(s.sink_overrides())"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == repr({"discord": {"retry_attempts": 5}, "email": {"timeout": 30.0}})
+
+
+def test_bad_config_is_reported_by_the_parser():
+    env = dict(os.environ, **{settings.CONFIG_ENV_VAR: "/nonexistent/config.py"})
+    result = subprocess.run([sys.executable, "-m", "ez_apply", "check"],
+                            capture_output=True, text=True, env=env)
+    assert result.returncode == 2
+    assert "Traceback" not in result.stderr
+    assert "Config file not found: /nonexistent/config.py" in result.stderr
+
+    env = dict(os.environ, SMTP_PORT="abc")
+    result = subprocess.run([sys.executable, "-m", "ez_apply", "check"],
+                            capture_output=True, text=True, env=env)
+    assert result.returncode == 2
+    assert "Traceback" not in result.stderr
+    assert "Invalid value for environment variable SMTP_PORT: 'abc'" in result.stderr
+
+
+def test_config_option_works_outside_the_repo():
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as config_dir, tempfile.TemporaryDirectory() as cwd:
+        config_file = os.path.join(config_dir, "config.py")
+        with open(config_file, 'w') as f:
+            f.write('DATA_FILE = "seen.pkl"\n')
+        with open(os.path.join(config_dir, "seen.pkl"), 'wb') as f:
+            pickle.dump({"Electrical Engineer", "Hardware Engineer"}, f)
+
+        result = subprocess.run([sys.executable, "-m", "ez_apply", "--config", config_file, "check"],
+                                capture_output=True, text=True, cwd=cwd, env=env)
+        assert result.returncode == 0, result.stderr
+        assert "No config.py found" not in result.stdout
+        assert "2 known jobs" in result.stdout  # DATA_FILE resolved next to config.py
+
+        env[settings.CONFIG_ENV_VAR] = config_file
+        result = subprocess.run([sys.executable, "-m", "ez_apply", "check"],
+                                capture_output=True, text=True, cwd=cwd, env=env)
+        assert "2 known jobs" in result.stdout
+
+        del env[settings.CONFIG_ENV_VAR]
+        result = subprocess.run([sys.executable, "-m", "ez_apply", "check"],
+                                capture_output=True, text=True, cwd=cwd, env=env)
+        assert "No config.py found" in result.stdout
+        assert "0 known jobs" in result.stdout
+
+
+def test_daemon_kills_scraper_that_hangs_with_output_open():
+    from ez_apply.daemon import run_scraper
+
+    command = [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(30)"]
+    start = time.monotonic()
+    assert not run_scraper(command, timeout=0.5)
+    assert time.monotonic() - start < 5
+
+
+def test_interrupting_daemon_kills_scraper():
+    harness = (
+        "import logging, sys\n"
+        "from ez_apply.daemon import run_scraper\n"
+        "logging.basicConfig(level=logging.INFO, stream=sys.stdout)\n"
+        "child = [sys.executable, '-c', "
+        "'import os, time; print(os.getpid(), flush=True); time.sleep(30)']\n"
+        "try:\n"
+        "    run_scraper(child, timeout=60)\n"
+        "except KeyboardInterrupt:\n"
+        "    print('interrupted', flush=True)\n"
+    )
+    daemon = subprocess.Popen([sys.executable, "-c", harness], stdout=subprocess.PIPE, text=True)
+    try:
+        for line in daemon.stdout:
+            if "SCRAPER: " in line:
+                child_pid = int(line.rsplit("SCRAPER: ", 1)[1])
+                break
+        daemon.send_signal(signal.SIGINT)
+        assert "interrupted" in daemon.communicate(timeout=10)[0]
+    finally:
+        if daemon.poll() is None:
+            daemon.kill()
+
+    try:
+        os.kill(child_pid, 0)
+        child_alive = True
+    except ProcessLookupError:
+        child_alive = False
+    assert not child_alive
+
+
+def test_parser_subcommands():
+    parser = build_parser()
+    assert parser.parse_args(["run", "--fixture", "jobs.json"]).fixture == "jobs.json"
+    assert parser.parse_args(["daemon", "--time", "09:00"]).time == "09:00"
+    assert parser.parse_args(["bench", "--imports"]).imports
+    assert parser.parse_args(["check"]).config is None
+    assert parser.parse_args(["--config", "a.py", "check"]).config == "a.py"
+    assert parser.parse_args(["check", "--config", "b.py"]).config == "b.py"
+
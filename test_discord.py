@@ -5,17 +5,14 @@ Test Discord notifications with sample job data
 
 import os
 import json
-# Import the scraper class from the main module
-import importlib.util
-spec = importlib.util.spec_from_file_location("ez_apply", "ez-apply.py")
-ez_apply = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(ez_apply)
-OpenAICareersScraper = ez_apply.OpenAICareersScraper
-JobPosting = ez_apply.JobPosting
+from ez_apply import settings
+from ez_apply.scraper import OpenAICareersScraper, JobPosting
 
 def test_discord_notification():
     """Test Discord notification with a sample job"""
     
+    settings.load()
+
     # Check if Discord webhook is configured
     discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
     
@@ -43,7 +40,13 @@ def test_discord_notification():
     print(f"Career Link: {sample_job.careerLink}")
     
     # Send notification
-    scraper.send_discord_notification(sample_job)
+    try:
+        results = scraper.notify([sample_job])
+    finally:
+        scraper.close()
+    if not results.get("discord"):
+        print("❌ Discord notification failed, check the logs")
+        return False
     
     print("✅ Discord notification test completed!")
     print("Check your Discord channel for the test message.")
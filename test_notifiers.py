@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Test notification sinks against local stand-ins
+Uses a fake HTTP webhook server and a local SMTP debugging server,
+so no real Discord/Slack/email account is needed.
+"""
+
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from ez_apply.notifiers import (
+    CircuitBreaker,
+    DiscordWebhookSink,
+    EmailSink,
+    JsonlFileSink,
+    NotificationDispatcher,
+    NotificationSink,
+    RetryPolicy,
+    SlackWebhookSink,
+)
+
+
+class SampleJob:
+    """Stand-in with the same fields as JobPosting"""
+    def __init__(self, title):
+        self.title = title
+        self.applyLink = f"https://jobs.ashbyhq.com/openai/{title.lower().replace(' ', '-')}"
+        self.careerLink = f"https://openai.com/careers/{title.lower().replace(' ', '-')}"
+
+
+SAMPLE_JOBS = [SampleJob("Electrical Engineer"), SampleJob("Hardware Engineer")]
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+class FakeWebhookServer:
+    """Local HTTP server recording JSON POST bodies, optionally failing or stalling"""
+
+    def __init__(self, status=204, delay=0.0, fail_on=()):
+        self.payloads = []
+        self.status = status
+        self.delay = delay
+        self.fail_on = set(fail_on)  # 1-based request numbers that get a 500
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                server.payloads.append(json.loads(self.rfile.read(length)))
+                time.sleep(server.delay)
+                failed = len(server.payloads) in server.fail_on
+                self.send_response(500 if failed else server.status)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/webhook"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class DebuggingSMTPServer:
+    """Minimal local SMTP server that keeps every received message in memory"""
+
+    def __init__(self):
+        self.messages = []
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(f"{line}\r\n".encode())
+
+            def handle(self):
+                self.reply("220 localhost debugging server")
+                sender, recipients = None, []
+                while True:
+                    line = self.rfile.readline().decode().rstrip("\r\n")
+                    command = line[:4].upper()
+                    if command in ("HELO", "EHLO"):
+                        self.reply("250 localhost")
+                    elif command == "MAIL":
+                        sender = line.split(":", 1)[1].strip()
+                        self.reply("250 OK")
+                    elif command == "RCPT":
+                        recipients.append(line.split(":", 1)[1].strip())
+                        self.reply("250 OK")
+                    elif command == "DATA":
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        data = []
+                        while True:
+                            data_line = self.rfile.readline().decode()
+                            if data_line.rstrip("\r\n") == ".":
+                                break
+                            data.append(data_line)
+                        server.messages.append((sender, recipients, "".join(data)))
+                        self.reply("250 OK")
+                    elif command == "QUIT" or not line:
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("250 OK")
+
+        self.server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_discord_sink():
+    server = FakeWebhookServer()
+    try:
+        sink = DiscordWebhookSink(server.url, retry=NO_RETRY)
+        assert sink.send(SAMPLE_JOBS)
+        assert sink.send([])
+        embeds = server.payloads[0]["embeds"]
+        assert [e["description"] for e in embeds] == ["**Electrical Engineer**", "**Hardware Engineer**"]
+        assert server.payloads[1]["embeds"][0]["title"] == "No New Jobs"
+    finally:
+        server.close()
+
+
+def test_discord_retry_does_not_repeat_delivered_chunks():
+    server = FakeWebhookServer(fail_on={2})
+    try:
+        jobs = [SampleJob(f"Electrical Engineer {i}") for i in range(15)]
+        sink = DiscordWebhookSink(server.url, retry=RetryPolicy(attempts=2, backoff=0))
+        assert sink.send(jobs)
+        assert [len(p["embeds"]) for p in server.payloads] == [10, 5, 5]
+        assert sink.deadline(jobs) == 2 * sink.deadline(jobs[:10])
+    finally:
+        server.close()
+
+
+def test_slack_sink():
+    server = FakeWebhookServer(status=200)
+    try:
+        sink = SlackWebhookSink(server.url, retry=NO_RETRY)
+        assert sink.send(SAMPLE_JOBS)
+        text = server.payloads[0]["text"]
+        assert "Electrical Engineer" in text and "Hardware Engineer" in text
+    finally:
+        server.close()
+
+
+def test_email_sink():
+    server = DebuggingSMTPServer()
+    try:
+        sink = EmailSink('127.0.0.1', server.port, "bot@example.com", ["me@example.com"],
+                         retry=NO_RETRY)
+        assert sink.send(SAMPLE_JOBS)
+        sender, recipients, data = server.messages[0]
+        assert sender == "<bot@example.com>"
+        assert recipients == ["<me@example.com>"]
+        assert "Subject: 2 new job(s) at OpenAI" in data
+        assert "Hardware Engineer" in data
+    finally:
+        server.close()
+
+
+def test_jsonl_file_sink():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "notifications.jsonl")
+        sink = JsonlFileSink(path, retry=NO_RETRY)
+        assert sink.send(SAMPLE_JOBS)
+        assert sink.send([])
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+        assert [r["event"] for r in records] == ["new_job", "new_job", "no_new_jobs"]
+        assert records[0]["title"] == "Electrical Engineer"
+
+
+def test_retry_then_circuit_breaker():
+    server = FakeWebhookServer(status=500)
+    try:
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        sink = DiscordWebhookSink(server.url, retry=RetryPolicy(attempts=2, backoff=0), breaker=breaker)
+        assert not sink.send(SAMPLE_JOBS)
+        assert len(server.payloads) == 2  # one retry
+        assert not sink.send(SAMPLE_JOBS)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not sink.send(SAMPLE_JOBS)
+        assert len(server.payloads) == 4  # open breaker skips the request
+    finally:
+        server.close()
+
+
+def test_circuit_breaker_state_survives_between_runs():
+    server = FakeWebhookServer(status=500)
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = os.path.join(tmp, "notify_state.pkl")
+
+        def run():
+            # Each scheduled run builds a fresh dispatcher in a new process
+            sink = DiscordWebhookSink(server.url, retry=NO_RETRY,
+                                      breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+            dispatcher = NotificationDispatcher([sink], state_file=state_file)
+            try:
+                return dispatcher.dispatch(SAMPLE_JOBS), sink.breaker.state
+            finally:
+                dispatcher.close()
+
+        try:
+            assert run() == ({"discord": False}, CircuitBreaker.CLOSED)
+            assert run() == ({"discord": False}, CircuitBreaker.OPEN)
+            assert run() == ({"discord": False}, CircuitBreaker.OPEN)
+            assert len(server.payloads) == 2  # third run skipped the sink
+        finally:
+            server.close()
+
+
+def test_undelivered_jobs_are_retried_next_run():
+    from ez_apply.scraper import OpenAICareersScraper
+
+    server = FakeWebhookServer(status=500)
+    jobs = [{"title": job.title, "applyLink": job.applyLink, "careerLink": job.careerLink}
+            for job in SAMPLE_JOBS]
+    with tempfile.TemporaryDirectory() as tmp:
+        def run():
+            sink = DiscordWebhookSink(server.url, retry=NO_RETRY)
+            dispatcher = NotificationDispatcher([sink])
+            scraper = OpenAICareersScraper(dispatcher=dispatcher)
+            scraper.data_file = os.path.join(tmp, "known_jobs.pkl")
+            scraper.load_known_jobs()
+            try:
+                scraper.scrape_and_notify(jobs)
+            finally:
+                dispatcher.close()
+            return scraper.known_job_titles
+
+        try:
+            assert run() == set()  # every sink failed, nothing marked as seen
+            server.status = 204
+            assert run() == {"Electrical Engineer", "Hardware Engineer"}
+            assert [len(p["embeds"]) for p in server.payloads] == [2, 2]
+            run()
+            assert server.payloads[-1]["embeds"][0]["title"] == "No New Jobs"
+        finally:
+            server.close()
+
+
+def test_build_sinks_per_sink_overrides():
+    from ez_apply.notifiers import build_sinks
+
+    sinks = build_sinks(discord_webhook_url="http://127.0.0.1/discord", smtp_host="127.0.0.1",
+                        email_from="bot@example.com", email_to=["me@example.com"],
+                        timeout=10, retry_attempts=3,
+                        overrides={"email": {"timeout": 30, "retry_attempts": 1}})
+    by_name = {sink.name: sink for sink in sinks}
+    assert (by_name["discord"].timeout, by_name["discord"].retry.attempts) == (10, 3)
+    assert (by_name["email"].timeout, by_name["email"].retry.attempts) == (30, 1)
+
+
+def test_circuit_breaker_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_dispatcher_fans_out_concurrently():
+    slow = FakeWebhookServer(delay=0.5)
+    fast = FakeWebhookServer()
+    dispatcher = NotificationDispatcher([
+        DiscordWebhookSink(slow.url, retry=NO_RETRY, name="slow"),
+        SlackWebhookSink(fast.url, retry=NO_RETRY, name="fast"),
+    ])
+    try:
+        start = time.monotonic()
+        results = dispatcher.dispatch(SAMPLE_JOBS)
+        elapsed = time.monotonic() - start
+        assert results == {"slow": True, "fast": True}
+        assert elapsed < 0.9  # sinks ran side by side, not one after another
+    finally:
+        dispatcher.close()
+        slow.close()
+        fast.close()
+
+
+def test_dispatcher_does_not_wait_for_hung_sink():
+    class HungSink(NotificationSink):
+        name = "hung"
+
+        def __init__(self):
+            super().__init__(timeout=0.1, retry=NO_RETRY)
+            self.release = threading.Event()
+
+        def deliver(self, jobs):
+            self.release.wait()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hung = HungSink()
+        file_sink = JsonlFileSink(os.path.join(tmp, "out.jsonl"), retry=NO_RETRY)
+        dispatcher = NotificationDispatcher([hung, file_sink])
+        try:
+            start = time.monotonic()
+            assert dispatcher.dispatch(SAMPLE_JOBS) == {"hung": False, "file": True}
+            # The still-running sink is skipped on the next batch instead of queueing up
+            assert dispatcher.dispatch([]) == {"hung": False, "file": True}
+            assert time.monotonic() - start < 0.5
+        finally:
+            hung.release.set()
+            dispatcher.close()
+
+
+def test_hung_sink_does_not_delay_process_exit():
+    # concurrent.futures joins its workers at interpreter exit, so measure the
+    # whole process, not just dispatch()
+    code = (
+        "import time\n"
+        "from ez_apply.notifiers import NotificationDispatcher, NotificationSink, RetryPolicy\n"
+        "class HungSink(NotificationSink):\n"
+        "    def deliver(self, jobs):\n"
+        "        time.sleep(3)\n"
+        "dispatcher = NotificationDispatcher([HungSink(timeout=0.2, retry=RetryPolicy(attempts=1))])\n"
+        "print(dispatcher.dispatch([]))\n"
+        "dispatcher.close()\n"
+    )
+    start = time.monotonic()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    elapsed = time.monotonic() - start
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "{'sink': False}"
+    assert elapsed < 2.0
+
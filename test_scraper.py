@@ -6,15 +6,12 @@ Runs the scraper in test mode without sending Discord notifications.
 
 import os
 import sys
-# Import the scraper class from the main module
-import importlib.util
-spec = importlib.util.spec_from_file_location("ez_apply", "ez-apply.py")
-ez_apply = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(ez_apply)
-OpenAICareersScraper = ez_apply.OpenAICareersScraper
+from ez_apply import settings
+from ez_apply.scraper import OpenAICareersScraper
 
 def test_scraper():
     """Test the scraper functionality"""
+    settings.load()
     print("🧪 Testing OpenAI Careers Job Scraper...")
     print("=" * 50)
     